@@ -0,0 +1,69 @@
+"""
+Skips engine verification tests that already passed against the current code.
+
+Only tests marked @pytest.mark.engine_sources("src.engines.x", ...) take part.
+Their fingerprint is the hash of the listed modules' sources plus the test's own
+file. Passing tests are recorded in the pytest cache under templo/last_pass; on
+the next run a test whose fingerprint is unchanged is skipped. Use --rerun-engines
+to run everything.
+"""
+import hashlib
+from typing import Dict, Optional, Tuple
+import pytest
+
+CACHE_KEY = "templo/last_pass"
+
+_fingerprints: Dict[Tuple[str, ...], str] = {}
+_passed: Dict[str, str] = {}
+
+def pytest_addoption(parser):
+    parser.addoption("--rerun-engines", action="store_true", help="ignore the engines fingerprint and run every test")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "engine_sources(*modules): skip the test while these modules and the test file are unchanged since it last passed")
+
+def _fingerprint(item) -> Optional[str]:
+    marker = item.get_closest_marker("engine_sources")
+    if marker is None:
+        return None
+    sources = tuple(sorted(marker.args)) + (str(item.path),)
+    if sources not in _fingerprints:
+        digest = hashlib.md5()
+        for module in marker.args:
+            # Path from the rootdir rather than find_spec, which may import the module or its parents
+            digest.update(item.config.rootpath.joinpath(*module.split(".")).with_suffix(".py").read_bytes())
+        digest.update(item.path.read_bytes())
+        _fingerprints[sources] = digest.hexdigest()
+    return _fingerprints[sources]
+
+def pytest_collection_modifyitems(config, items):
+    cache = getattr(config, "cache", None)
+    last_pass = {} if cache is None or config.getoption("--rerun-engines") else cache.get(CACHE_KEY, {})
+    skip = pytest.mark.skip(reason="engines unchanged since last pass")
+    for item in items:
+        fingerprint = _fingerprint(item)
+        if fingerprint is None:
+            continue
+        # Carried on the report, so an xdist controller (which collects nothing) sees it too
+        item.user_properties.append(("engine_fingerprint", fingerprint))
+        if last_pass.get(item.nodeid) == fingerprint:
+            item.add_marker(skip)
+
+def pytest_runtest_logreport(report):
+    # A skipped test keeps its previous entry; a failure removes it
+    fingerprint = dict(report.user_properties).get("engine_fingerprint")
+    if fingerprint is None:
+        return
+    if report.when == "call" and report.passed:
+        _passed[report.nodeid] = fingerprint
+    elif report.failed:
+        _passed[report.nodeid] = ""
+
+def pytest_sessionfinish(session):
+    config = session.config
+    cache = getattr(config, "cache", None)
+    if cache is None or hasattr(config, "workerinput"): # xdist workers report to the controller
+        return
+    last_pass = cache.get(CACHE_KEY, {})
+    last_pass.update(_passed)
+    cache.set(CACHE_KEY, {nodeid: fp for nodeid, fp in last_pass.items() if fp})
@@ -27,7 +27,7 @@ from src.shared.drive_utils import (  # type: ignore
     get_drive_service, 
     get_docs_service, 
     ensure_folder as find_or_create_folder,
-    create_google_doc
+    create_google_docs
 )
 
 
@@ -39,7 +39,7 @@ def get_services(creds):
 
 
 
-# Removed redundant find_or_create_folder and create_google_doc (now imported)
+# Removed redundant find_or_create_folder and create_google_docs (now imported)
 
 
 
@@ -900,9 +900,9 @@ def build_structure(drive, docs, tree: dict, parent_id: Optional[str] = None):
         if isinstance(children, dict):
             # Create docs if defined
             doc_list = children.pop("_docs", [])
-            for doc_title in doc_list:
-                content = DOCS.get(doc_title, f"[Content pending for: {doc_title}]")
-                create_google_doc(drive, docs, doc_title, folder_id, content)
+            if doc_list:
+                contents = {doc_title: DOCS.get(doc_title, f"[Content pending for: {doc_title}]") for doc_title in doc_list}
+                create_google_docs(drive, docs, folder_id, contents)
 
             # Recurse into subfolders
             if children:
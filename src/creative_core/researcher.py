@@ -12,6 +12,7 @@ from src.shared.drive_utils import (  # type: ignore
     upload_file
 )
 from src.shared.logger import AgentLogger  # type: ignore
+from src.shared.llm_cache import generate_content  # type: ignore
 
 def researcher_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -57,7 +58,8 @@ def researcher_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     
     try:
-        response = client.models.generate_content(
+        response = generate_content(
+            client,
             model="gemini-2.0-flash",
             contents=prompt,
         )
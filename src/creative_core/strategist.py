@@ -14,6 +14,7 @@ from src.shared.drive_utils import (  # type: ignore
     upload_file
 )
 from src.shared.logger import AgentLogger  # type: ignore
+from src.shared.llm_cache import generate_content  # type: ignore
 from src.shared.db import ProjectOS # type: ignore
 from pathlib import Path
 
@@ -103,7 +104,8 @@ def strategy_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     
     try:
-        response = client.models.generate_content(
+        response = generate_content(
+            client,
             model="gemini-2.0-flash",
             contents=prompt,
         )
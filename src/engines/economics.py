@@ -1,7 +1,10 @@
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 from sqlmodel import SQLModel, Field as SQLField
 from datetime import datetime
+import sys
+import time
 import uuid
 
 # --- Models ---
@@ -32,6 +35,8 @@ class Quote(BaseModel):
     valid_until: datetime
 
 # --- Engine ---
+QUOTE_CACHE_PROJECTS = 256
+
 class EconomicsEngine:
     def __init__(self):
         self.budgets: Dict[str, Budget] = {}
@@ -42,11 +47,17 @@ class EconomicsEngine:
             "token_output": 0.000002,
             "tool_call": 0.01 
         }
+        # project_id -> complexity_score -> (monotonic created_at, quote); projects kept LRU
+        self.quote_ttl = 60.0 # seconds
+        self._quote_cache: "OrderedDict[str, Dict[int, Tuple[float, Quote]]]" = OrderedDict()
 
     def set_budget(self, project_id: str, cap: float):
         self.budgets[project_id] = Budget(project_id=project_id, total_cap=cap)
+        self._quote_cache.pop(project_id, None)
 
     def log_cost(self, project_id: str, agent: str, tool: str, tokens_in: int = 0, tokens_out: int = 0):
+        # Agent/tool names repeat across thousands of events; share one string object each
+        agent, tool = sys.intern(agent), sys.intern(tool)
         cost = (tokens_in * self.rates["token_input"]) + \
                (tokens_out * self.rates["token_output"]) + \
                self.rates["tool_call"]
@@ -64,6 +75,37 @@ class EconomicsEngine:
         
         if project_id in self.budgets:
             self.budgets[project_id].current_burn += cost
+        self._quote_cache.pop(project_id, None)
+
+    def log_cost_batch(self, project_id: str, agents: List[str], tools: List[str], tokens_in: List[int], tokens_out: List[int]):
+        """Logs many actions at once: one ledger event per (agent, tool) pair, one budget update.
+        The four lists must have the same length; a mismatch raises ValueError before anything is logged."""
+        # agent, tool -> [actions, tokens_in, tokens_out]
+        totals: Dict[tuple, List[int]] = {}
+        for agent, tool, t_in, t_out in zip(agents, tools, tokens_in, tokens_out, strict=True):
+            group = totals.setdefault((agent, tool), [0, 0, 0])
+            group[0] += 1
+            group[1] += t_in
+            group[2] += t_out
+
+        batch_cost = 0.0
+        for (agent, tool), (actions, t_in, t_out) in totals.items():
+            cost = (t_in * self.rates["token_input"]) + \
+                   (t_out * self.rates["token_output"]) + \
+                   actions * self.rates["tool_call"]
+            self.ledger.append(CostEvent(
+                project_id=project_id,
+                agent_name=sys.intern(agent),
+                tool_name=sys.intern(tool),
+                tokens_used=t_in + t_out,
+                cost_amount=cost,
+                description=f"{actions} actions by {agent} using {tool}"
+            ))
+            batch_cost += cost
+
+        if project_id in self.budgets:
+            self.budgets[project_id].current_burn += batch_cost
+        self._quote_cache.pop(project_id, None)
 
     def check_budget(self, project_id: str) -> bool:
         """Returns True if budget is available."""
@@ -72,12 +114,30 @@ class EconomicsEngine:
         return self.budgets[project_id].remaining > 0
 
     def generate_quote(self, project_id: str, complexity_score: int) -> Quote:
-        """Stub logic for quote generation."""
+        """Stub logic for quote generation. Estimates are reused for quote_ttl seconds."""
+        now = time.monotonic()
+        project_quotes = self._quote_cache.get(project_id)
+        if project_quotes is not None:
+            self._quote_cache.move_to_end(project_id)
+            cached = project_quotes.get(complexity_score)
+            if cached is not None and now - cached[0] < self.quote_ttl:
+                # Fresh copy: callers may mutate it, and valid_until is stamped per quote
+                return cached[1].model_copy(update={"valid_until": datetime.utcnow()})
+
         base_rate = 500.0
         estimate = base_rate * complexity_score
-        return Quote(
+        quote = Quote(
             project_id=project_id,
             estimated_cost=estimate,
             rationale=f"Base ${base_rate} x Complexity {complexity_score}",
             valid_until=datetime.utcnow()
         )
+
+        if project_quotes is None:
+            project_quotes = self._quote_cache[project_id] = {}
+            if len(self._quote_cache) > QUOTE_CACHE_PROJECTS:
+                self._quote_cache.popitem(last=False)
+        for score in [c for c, (created, _) in project_quotes.items() if now - created >= self.quote_ttl]:
+            del project_quotes[score]
+        project_quotes[complexity_score] = (now, quote.model_copy())
+        return quote
@@ -1,6 +1,8 @@
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from collections import OrderedDict
+from typing import List, Dict, Optional, Set, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+import re
 import uuid
 
 # --- Models ---
@@ -16,25 +18,126 @@ class Signal(BaseModel):
     tags: List[str] = []
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+    # Immutable once built: the engine indexes signals at ingest time
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def content_key(self) -> Tuple[str, str, str, str, str]:
+        """Identity for dedup (id/timestamp differ between re-reports of the same signal)."""
+        return (self.domain, self.signal_type, self.entity, self.element, self.observation)
+
 # --- Engine ---
+QUERY_CACHE_SIZE = 128
+RESERVOIR_CAP = 100_000
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 class PerceptionEngine:
-    def __init__(self):
-        self.reservoir: List[Signal] = []
+    def __init__(self, capacity: int = RESERVOIR_CAP):
+        if capacity <= 0:
+            raise ValueError(f"Reservoir capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        # Ring buffer: the signal with absolute (ingest-order) position p lives in
+        # _ring[p % capacity]; once full, each ingest overwrites the oldest signal.
+        self._ring: List[Signal] = []
+        self._next = 0
+        self._seen: Set[Tuple[str, str, str, str, str]] = set()
+        # token -> absolute positions of signals whose observation/entity contain it.
+        # Evicted positions are skipped at query time and purged by a rebuild once
+        # they make up a quarter of the reservoir.
+        self._index: Dict[str, List[int]] = {}
+        self._stale = 0
+        # Bumped on every ingest; cached query results from an older generation are stale
+        self._generation = 0
+        self._query_cache: "OrderedDict[str, Tuple[int, List[Signal]]]" = OrderedDict()
+
+    @property
+    def _base(self) -> int:
+        """Absolute position of the oldest signal still held."""
+        return max(0, self._next - self.capacity)
+
+    @property
+    def reservoir(self) -> List[Signal]:
+        """Held signals, oldest first."""
+        start = self._base % self.capacity
+        return self._ring[start:] + self._ring[:start]
 
     def ingest_signal(self, signal: Signal):
-        self.reservoir.append(signal)
+        if signal.content_key in self._seen:
+            return
+        self._append(signal)
+        self._invalidate()
         # TODO: Persist to Vector Memory via MemorySystem?
         # For Phase 3 foundation: In-memory list (ephemeral) or append to file.
 
+    def ingest_batch(self, signals: List[Signal]):
+        """Bulk ingest: cached queries are invalidated once for the batch. Duplicates are dropped."""
+        added = False
+        for signal in signals:
+            if signal.content_key not in self._seen:
+                self._append(signal)
+                added = True
+        if added:
+            self._invalidate()
+
+    def _append(self, signal: Signal):
+        pos = self._next
+        if pos < self.capacity:
+            self._ring.append(signal)
+        else:
+            slot = pos % self.capacity
+            # Forget the evicted signal so it can be re-ingested
+            self._seen.discard(self._ring[slot].content_key)
+            self._ring[slot] = signal
+            self._stale += 1
+        self._next += 1
+        self._seen.add(signal.content_key)
+        self._index_signal(pos, signal)
+
+    def _index_signal(self, pos: int, signal: Signal):
+        text = f"{signal.observation} {signal.entity}".lower()
+        for token in set(_TOKEN_RE.findall(text)):
+            self._index.setdefault(token, []).append(pos)
+
+    def _rebuild_index(self):
+        self._index = {}
+        for pos in range(self._base, self._next):
+            self._index_signal(pos, self._ring[pos % self.capacity])
+        self._stale = 0
+
+    def _invalidate(self):
+        self._generation += 1
+        self._query_cache.clear()
+
     def query_reservoir(self, topic: str) -> List[Signal]:
-        """Simple keyword matching for now."""
-        results = []
+        """Simple keyword matching for now. Results are memoized (LRU) until the next ingest."""
         topic = topic.lower()
-        for sig in self.reservoir:
-            if topic in sig.observation.lower() or topic in sig.entity.lower():
-                results.append(sig)
-        return results
+        cached = self._query_cache.get(topic)
+        if cached is not None and cached[0] == self._generation:
+            self._query_cache.move_to_end(topic)
+            return list(cached[1])
+
+        if _TOKEN_RE.fullmatch(topic):
+            if self._stale * 4 > len(self._ring):
+                self._rebuild_index()
+            # An alphanumeric topic can only occur inside a single token, so the
+            # (small) vocabulary is scanned instead of every signal.
+            hits = set()
+            for token, positions in self._index.items():
+                if topic in token:
+                    hits.update(positions)
+            base, ring, capacity = self._base, self._ring, self.capacity
+            results = [ring[pos % capacity] for pos in sorted(hits) if pos >= base]
+        else:
+            results = [
+                sig for sig in self.reservoir
+                if topic in sig.observation.lower() or topic in sig.entity.lower()
+            ]
+
+        self._query_cache[topic] = (self._generation, results)
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return list(results)
 
     def generate_digest(self, domain: str) -> str:
-        domain_signals = [s for s in self.reservoir if s.domain == domain]
+        domain_signals = [s for s in self._ring if s.domain == domain]
         return f"Found {len(domain_signals)} signals for {domain}."
@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, Any, List, Optional, Callable
 from pydantic import BaseModel, Field
 
@@ -23,7 +24,7 @@ class ToolRouter:
         self.register_tool("search", self._handle_search)
 
     def register_tool(self, name: str, handler: Callable):
-        self.registry[name] = handler
+        self.registry[sys.intern(name)] = handler
 
     def route(self, request: ToolRequest) -> ToolResult:
         handler = self.registry.get(request.tool_name)
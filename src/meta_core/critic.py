@@ -3,6 +3,7 @@ import os
 import json
 from google import genai  # type: ignore
 from src.shared.logger import AgentLogger  # type: ignore
+from src.shared.llm_cache import generate_content  # type: ignore
 
 def intelligence_critic_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -48,7 +49,7 @@ def intelligence_critic_agent(state: Dict[str, Any]) -> Dict[str, Any]:
         Return "FAIL: reason" if they attempted creative authorship.
         """
         try:
-            response = client.models.generate_content(model="gemini-2.0-flash", contents=prompt)
+            response = generate_content(client, model="gemini-2.0-flash", contents=prompt)
             if "FAIL" in response.text.toUpperCase():
                 findings.append(f"Strategic Audit Failure: {response.text}")
         except:
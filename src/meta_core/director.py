@@ -3,6 +3,7 @@ import os
 import json
 from google import genai  # type: ignore
 from src.shared.logger import AgentLogger  # type: ignore
+from src.shared.llm_cache import generate_content  # type: ignore
 from src.shared.drive_utils import (  # type: ignore
     get_drive_service,
     get_docs_service,
@@ -72,7 +73,8 @@ def director_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     """
 
     try:
-        response = client.models.generate_content(
+        response = generate_content(
+            client,
             model="gemini-2.0-flash",
             contents=prompt,
             config={ "response_mime_type": "application/json" }
@@ -118,7 +120,11 @@ def director_agent(state: Dict[str, Any]) -> Dict[str, Any]:
                 session.commit()
             logger.log("Director", "Studio OS Dashboard synchronized.")
 
-        return {"briefing_pack": briefing_content}
+        return {
+            "briefing_pack": briefing_content,
+            "current_status": "Executive Briefing Ready",
+            "review_status": "PENDING"
+        }
 
     except Exception as e:
         logger.log("Director", f"Synthesis failed: {e}", severity="ERROR")
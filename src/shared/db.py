@@ -1,4 +1,7 @@
+import os
 from typing import Optional, List, Any
+from sqlalchemy import event  # type: ignore
+from sqlalchemy.engine import make_url  # type: ignore
 from sqlmodel import Field, SQLModel, create_engine, Session  # type: ignore
 from datetime import datetime
 # vFinal Imports
@@ -10,7 +13,7 @@ from src.engines.observability import AuditLog, ThoughtStream
 
 class Project(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str
+    name: str = Field(index=True)
     category: str = "Brand Identity"  # Brand Identity | Web Design | Packaging | Product Design
     client: Optional[str] = None
     status: str = "Intake"
@@ -153,8 +156,30 @@ class WorkflowStep(SQLModel, table=True):
 # --- Database Setup ---
 sqlite_file_name = "storage/studio.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
+database_url = os.environ.get("DATABASE_URL", sqlite_url)
+
+if database_url.startswith("sqlite"):
+    # Checkpoint writes and agent logs come from several threads; the default QueuePool
+    # gives each its own connection, and WAL lets readers proceed while one commits.
+    engine = create_engine(database_url, connect_args={"check_same_thread": False}, insertmanyvalues_page_size=1000)
 
-engine = create_engine(sqlite_url)
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+else:
+    engine_kwargs: dict = {"pool_size": 8, "max_overflow": 16, "pool_pre_ping": True, "insertmanyvalues_page_size": 1000}
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+        # Multi-VALUES INSERTs and batched UPDATE/DELETE for executemany
+        engine_kwargs.update(executemany_mode="values_plus_batch", executemany_batch_page_size=500)
+    elif url.get_backend_name() == "mssql" and url.get_driver_name() == "pyodbc":
+        engine_kwargs["fast_executemany"] = True
+    engine = create_engine(database_url, **engine_kwargs)
 
 # --- Real-Time Sync Utility (ProjectOS) ---
 
@@ -163,55 +188,105 @@ class ProjectOS:
     Centralized utility for agents to sync their intelligence to the Studio OS.
     Ensures real-time updates for the cloud dashboard.
     """
+    @staticmethod
+    def _apply_intelligence(project: Project, key: str, value: Any):
+        import json
+        if key == "strategy":
+            project.strategy_json = json.dumps(value)
+        elif key == "research":
+            project.research_insights_json = json.dumps(value)
+        elif key == "timeline":
+            project.timeline_json = json.dumps(value)
+        elif key == "dod":
+            project.deliverables_json = json.dumps(value)
+        elif key == "risks":
+            project.risks_json = json.dumps(value)
+
+    @staticmethod
+    def _apply_status(project: Project, agent_name: str, clean_status: str, cycles: Optional[int] = None):
+        project.active_agent = agent_name
+        project.status = clean_status
+        if cycles is not None:
+            project.cycle_count = cycles
+
+    @staticmethod
+    def _health_expr(project_id: int, cycle_count: Any):
+        """SQL expression for DERIVED HEALTH, the single definition of the rule.
+        Logic: 100 - (cycles * 15) - (total errors * 5), clamped to 0-100"""
+        from sqlalchemy import case # type: ignore
+        from sqlmodel import select, func # type: ignore
+        error_count = select(func.count(AgentLog.id)).where(
+            AgentLog.project_id == project_id, AgentLog.severity == "ERROR"
+        ).scalar_subquery()
+        health = 100 - (cycle_count * 15) - (error_count * 5)
+        return case((health < 0, 0), (health > 100, 100), else_=health)
+
     @staticmethod
     def update_intelligence(project_id: int, key: str, value: Any):
         """Pushes structured intelligence to a specific project field."""
-        import json
         with Session(engine) as session:
             project = session.get(Project, project_id)
             if project:
-                if key == "strategy":
-                    project.strategy_json = json.dumps(value)
-                elif key == "research":
-                    project.research_insights_json = json.dumps(value)
-                elif key == "timeline":
-                    project.timeline_json = json.dumps(value)
-                elif key == "dod":
-                    project.deliverables_json = json.dumps(value)
-                elif key == "risks":
-                    project.risks_json = json.dumps(value)
-                
+                ProjectOS._apply_intelligence(project, key, value)
                 project.last_pulse = datetime.utcnow()
                 session.add(project)
                 session.commit()
 
     @staticmethod
-    def update_status(project_id: int, agent_name: str, status: str, cycles: Optional[int] = None):
-        """Updates the operational pulse, translates status, and recalculates health."""
+    def update_status(project_id: int, agent_name: str, status: str, cycles: Optional[int] = None) -> str:
+        """Updates the operational pulse, translates status, and recalculates health. Returns the stored status."""
         # Translate to Founder Language
         clean_status = AgentTranslator.translate(agent_name, status)
         
+        # One UPDATE statement: no SELECT/hydrate of the project, health derived in SQL
+        from sqlalchemy import update # type: ignore
+        cycle_count = cycles if cycles is not None else Project.cycle_count
+
+        with Session(engine) as session:
+            session.execute(
+                update(Project).where(Project.id == project_id).values( # type: ignore
+                    active_agent=agent_name,
+                    status=clean_status,
+                    cycle_count=cycle_count,
+                    health_score=ProjectOS._health_expr(project_id, cycle_count),
+                    last_pulse=datetime.utcnow()
+                ),
+                execution_options={"synchronize_session": False}
+            )
+            session.commit()
+        return clean_status
+
+    @staticmethod
+    def batch_update(project_id: int, patches: List[dict]):
+        """Applies several updates in a single transaction.
+
+        Each patch is either {"key": ..., "value": ...} (as update_intelligence)
+        or {"agent": ..., "status": ..., "cycles": ...} (as update_status).
+        """
         with Session(engine) as session:
             project = session.get(Project, project_id)
-            if project:
-                project.active_agent = agent_name
-                project.status = clean_status
-                if cycles is not None:
-                    project.cycle_count = cycles
-                
-                # DERIVE REAL HEALTH
-                # Logic: 100 - (cycles * 15) - (total errors * 5)
-                from sqlmodel import select, func # type: ignore
-                error_count = session.exec(
-                    select(func.count(AgentLog.id)).where(AgentLog.project_id == project_id, AgentLog.severity == "ERROR")
-                ).one()
-                
-                health = 100 - (project.cycle_count * 15) - (error_count * 5)
-                project.health_score = max(0, min(100, health))
-                
-                project.last_pulse = datetime.utcnow()
-                session.add(project)
-                session.commit()
+            if not project:
+                return
+            status_changed = False
+            for patch in patches:
+                if "key" in patch:
+                    ProjectOS._apply_intelligence(project, patch["key"], patch["value"])
+                else:
+                    clean_status = AgentTranslator.translate(patch["agent"], patch["status"])
+                    ProjectOS._apply_status(project, patch["agent"], clean_status, patch.get("cycles"))
+                    status_changed = True
+            project.last_pulse = datetime.utcnow()
+            session.add(project)
+            if status_changed:
+                from sqlalchemy import update # type: ignore
+                session.flush() # cycle_count must be written before health reads it
+                session.execute(
+                    update(Project).where(Project.id == project_id).values( # type: ignore
+                        health_score=ProjectOS._health_expr(project_id, Project.cycle_count)
+                    ),
+                    execution_options={"synchronize_session": False}
+                )
+            session.commit()
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
@@ -13,6 +13,8 @@ from google.oauth2.credentials import Credentials  # type: ignore
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
 from googleapiclient.discovery import build  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 def retry_drive_op(max_retries: int = 3, initial_delay: float = 1.0):
     """Decorator for exponential backoff on Drive operations."""
     def decorator(func):
@@ -26,24 +28,26 @@ def retry_drive_op(max_retries: int = 3, initial_delay: float = 1.0):
                 except Exception as e:
                     retries += 1
                     if retries == max_retries:
-                        print(f"[Drive] Operation failed after {max_retries} attempts: {e}")
+                        logger.error("[Drive] Operation failed after %d attempts: %s", max_retries, e)
                         raise
                     jitter = random.uniform(0, 0.1 * delay)
                     sleep_time = delay + jitter
-                    print(f"[Drive] Error: {e}. Retrying in {sleep_time:.2f}s (Attempt {retries}/{max_retries})")
+                    logger.warning("[Drive] Error: %s. Retrying in %.2fs (Attempt %d/%d)", e, sleep_time, retries, max_retries)
                     time.sleep(sleep_time)
                     delay *= 2
             return None
         return wrapper
     return decorator
 
-logger = logging.getLogger(__name__)
-
 SCOPES = [
     'https://www.googleapis.com/auth/drive',
     'https://www.googleapis.com/auth/documents',
 ]
 
+# Files above this size use a chunked resumable upload; smaller ones go in a single multipart request
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
 def get_credentials():
     """Handles OAuth2 authentication flow and returns credentials."""
     # Look for token.json in root
@@ -85,16 +89,31 @@ def get_docs_service(creds=None):
         creds = get_credentials()
     return build('docs', 'v1', credentials=creds)
 
+# Resolved folder ids, keyed by (parent_id or "root", name) -> (id, monotonic resolved_at).
+# Only hits are cached, so a folder that appears later is still found. Entries expire
+# after FOLDER_CACHE_TTL so long-running processes notice folders trashed elsewhere
+# (e.g. by cleanup_drive_projects.py).
+FOLDER_CACHE_TTL = 60.0 # seconds
+_folder_cache: Dict[tuple, tuple] = {}
+
 @retry_drive_op()
 def find_folder(drive, name: str, parent_id: Optional[str] = None) -> Optional[str]:
     """Finds a folder by name, optionally within a parent."""
+    cache_key = (parent_id or "root", name)
+    cached = _folder_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < FOLDER_CACHE_TTL:
+        return cached[0]
+
     query = f"name='{name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
     if parent_id:
         query += f" and '{parent_id}' in parents"
 
-    results = drive.files().list(q=query, spaces='drive', fields='files(id, name)').execute()
+    results = drive.files().list(q=query, spaces='drive', corpora='user', fields='files(id)', pageSize=1).execute()
     files = results.get('files', [])
-    return files[0]['id'] if files else None
+    if not files:
+        return None
+    _folder_cache[cache_key] = (files[0]['id'], time.monotonic())
+    return files[0]['id']
 
 @retry_drive_op()
 def create_folder(drive, name: str, parent_id: Optional[str] = None) -> str:
@@ -107,6 +126,7 @@ def create_folder(drive, name: str, parent_id: Optional[str] = None) -> str:
         metadata['parents'] = [parent_id]
 
     folder = drive.files().create(body=metadata, fields='id').execute()
+    _folder_cache[(parent_id or "root", name)] = (folder['id'], time.monotonic())
     return folder['id']
 
 def ensure_folder(drive, name: str, parent_id: Optional[str] = None) -> str:
@@ -128,7 +148,7 @@ def upload_file(drive, file_path: str, parent_id: str) -> Optional[str]:
 
     # Check if file already exists in this folder
     query = f"name='{path.name}' and '{parent_id}' in parents and trashed=false"
-    results = drive.files().list(q=query, spaces='drive', fields='files(id)').execute()
+    results = drive.files().list(q=query, spaces='drive', corpora='user', fields='files(id)', pageSize=1).execute()
     existing_files = results.get('files', [])
 
     file_metadata = {
@@ -150,17 +170,33 @@ def upload_file(drive, file_path: str, parent_id: str) -> Optional[str]:
         mime_type = 'application/pdf'
 
     try:
-        media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
+        size = path.stat().st_size
+        resumable = size > RESUMABLE_THRESHOLD
+        media = MediaFileUpload(
+            file_path,
+            mimetype=mime_type,
+            resumable=resumable,
+            chunksize=RESUMABLE_CHUNK_SIZE if resumable else -1
+        )
         
         if existing_files:
             file_id = existing_files[0]['id']
             # Update existing file
-            file = drive.files().update(fileId=file_id, media_body=media, fields='id').execute() # type: ignore
-            return file.get('id')
+            request = drive.files().update(fileId=file_id, media_body=media, fields='id') # type: ignore
         else:
             # Create new file
-            file = drive.files().create(body=file_metadata, media_body=media, fields='id').execute() # type: ignore
+            request = drive.files().create(body=file_metadata, media_body=media, fields='id') # type: ignore
+
+        if not resumable:
+            file = request.execute()
             return file.get('id')
+
+        file = None
+        while file is None:
+            status, file = request.next_chunk()
+            if status:
+                logger.info("[Drive] Uploading %s: %d%%", path.name, int(status.progress() * 100))
+        return file.get('id')
     except Exception as e:
         print(f"Error uploading {file_path}: {e}")
         return None
@@ -169,7 +205,7 @@ def create_google_doc(drive, docs, title: str, parent_id: str, content: str) ->
     """Creates a Google Doc with content."""
     # Check if doc already exists
     query = f"name='{title}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false"
-    results = drive.files().list(q=query, spaces='drive', fields='files(id)').execute()
+    results = drive.files().list(q=query, spaces='drive', corpora='user', fields='files(id)', pageSize=1).execute()
     existing = results.get('files', [])
 
     if existing:
@@ -185,11 +221,98 @@ def create_google_doc(drive, docs, title: str, parent_id: str, content: str) ->
     doc_id = file['id']
 
     # Write content using Docs API
-    requests = [{
+    docs.documents().batchUpdate(documentId=doc_id, body={'requests': _insert_text_requests(content)}).execute()
+    return doc_id
+
+# Google's batch endpoints accept a bounded number of calls per HTTP request
+DOCS_BATCH_LIMIT = 50
+
+def _insert_text_requests(content: str) -> List[Dict[str, Any]]:
+    return [{
         'insertText': {
             'location': {'index': 1},
             'text': content
         }
     }]
-    docs.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
-    return doc_id
+
+@retry_drive_op()
+def _write_doc_content(docs, doc_id: str, content: str):
+    docs.documents().batchUpdate(documentId=doc_id, body={'requests': _insert_text_requests(content)}).execute()
+
+def create_google_docs(drive, docs, parent_id: str, contents: Dict[str, str]) -> Dict[str, str]:
+    """Creates several Google Docs in one folder. Returns {title: doc_id}.
+
+    Existing docs are resolved with one paginated list, and the content writes
+    for new docs are sent as one batched Docs request instead of one per doc.
+    Writes that fail in the batch are retried individually; a doc that still
+    cannot be written is deleted (so the next run recreates it) and reported.
+    """
+    query = f"'{parent_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false"
+    doc_ids: Dict[str, str] = {}
+    page_token = None
+    while True:
+        results = drive.files().list(
+            q=query, spaces='drive', corpora='user', fields='nextPageToken, files(id, name)',
+            pageSize=1000, pageToken=page_token
+        ).execute()
+        doc_ids.update({f['name']: f['id'] for f in results.get('files', []) if f['name'] in contents})
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            break
+
+    failed: List[str] = [] # doc ids whose batched write failed
+    written = set()
+
+    def _on_write(request_id, response, exception):
+        if exception is not None:
+            logger.warning("[Drive] Batched write failed for doc %s: %s", request_id, exception)
+            failed.append(request_id)
+        else:
+            written.add(request_id)
+
+    def _execute(batch, batch_doc_ids: List[str]):
+        try:
+            batch.execute()
+        except Exception as e:
+            # Transport/5xx on the batch itself: every doc without a confirmed write goes to the retry path
+            logger.warning("[Drive] Batch of %d doc writes failed: %s", len(batch_doc_ids), e)
+            failed.extend(d for d in batch_doc_ids if d not in written and d not in failed)
+
+    batch = docs.new_batch_http_request(callback=_on_write)
+    batch_doc_ids: List[str] = []
+    new_docs: Dict[str, str] = {} # doc_id -> title
+    for title, content in contents.items():
+        if title in doc_ids:
+            continue
+
+        file_metadata = {
+            'name': title,
+            'mimeType': 'application/vnd.google-apps.document',
+            'parents': [parent_id],
+        }
+        file = drive.files().create(body=file_metadata, fields='id').execute()
+        doc_ids[title] = file['id']
+        new_docs[file['id']] = title
+
+        batch.add(docs.documents().batchUpdate(documentId=file['id'], body={'requests': _insert_text_requests(content)}), request_id=file['id'])
+        batch_doc_ids.append(file['id'])
+        if len(batch_doc_ids) == DOCS_BATCH_LIMIT:
+            _execute(batch, batch_doc_ids)
+            batch = docs.new_batch_http_request(callback=_on_write)
+            batch_doc_ids = []
+
+    if batch_doc_ids:
+        _execute(batch, batch_doc_ids)
+
+    unwritten = []
+    for doc_id in failed:
+        title = new_docs[doc_id]
+        try:
+            _write_doc_content(docs, doc_id, contents[title])
+        except Exception:
+            drive.files().delete(fileId=doc_id).execute()
+            del doc_ids[title]
+            unwritten.append(title)
+    if unwritten:
+        raise RuntimeError(f"Failed to write content for docs: {', '.join(unwritten)}")
+    return doc_ids
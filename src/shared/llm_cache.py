@@ -0,0 +1,80 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: replays stored answers for identical prompts, which is what fixed-brief
+# verification runs want but not live client work.
+CACHE_ENABLED = os.environ.get("STUDIO_LLM_CACHE") == "1"
+
+class PromptCache:
+    """
+    Prompt -> response cache keyed by the exact prompt hash.
+    No similarity fallback: agent prompts share a long fixed template, so prompts
+    for different briefs (or a revision with new critic feedback) look alike.
+    Entries persist as JSONL, one file per namespace (model + output config).
+    """
+    def __init__(self, cache_dir: str = "storage/llm_cache"):
+        self.cache_dir = Path(cache_dir)
+        self._by_key: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, namespace: str):
+        if namespace in self._by_key:
+            return
+        entries: Dict[str, str] = {}
+        path = self.cache_dir / f"{namespace}.jsonl"
+        if path.exists():
+            with open(path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[entry["key"]] = entry["value"]
+        self._by_key[namespace] = entries
+
+    def lookup(self, namespace: str, text: str) -> Optional[str]:
+        with self._lock:
+            self._load(namespace)
+            return self._by_key[namespace].get(hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+    def store(self, namespace: str, text: str, value: str):
+        with self._lock:
+            self._load(namespace)
+            entry = {"key": hashlib.sha256(text.encode("utf-8")).hexdigest(), "value": value}
+            self._by_key[namespace][entry["key"]] = value
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{namespace}.jsonl", "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+class CachedResponse:
+    """Stand-in for a genai response on a cache hit (callers only read .text)."""
+    def __init__(self, text: str):
+        self.text = text
+
+llm_cache = PromptCache()
+
+def generate_content(client, model: str, contents: str, config: Optional[Dict[str, Any]] = None):
+    """client.models.generate_content with an optional prompt cache in front of it."""
+    kwargs: Dict[str, Any] = {"model": model, "contents": contents}
+    if config is not None:
+        kwargs["config"] = config
+    if not CACHE_ENABLED:
+        return client.models.generate_content(**kwargs)
+
+    namespace = model
+    if config is not None:
+        namespace += "-" + hashlib.sha1(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+
+    hit = llm_cache.lookup(namespace, contents)
+    if hit is not None:
+        logger.debug("[LLMCache] Hit in '%s'", namespace)
+        return CachedResponse(hit)
+    response = client.models.generate_content(**kwargs)
+    if response.text:
+        llm_cache.store(namespace, contents, response.text)
+    return response
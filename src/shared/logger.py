@@ -1,19 +1,106 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List
 from .db import AgentLog, engine  # type: ignore
 from sqlmodel import Session  # type: ignore
 
+_FLUSH_INTERVAL = 0.1 # seconds
+_FLUSH_BATCH_SIZE = 50
+_LOG_BUFFER_CAPACITY = 200
+
+_log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+logger = logging.getLogger(__name__)
+
+def _write_batch(batch: List[Dict[str, Any]]):
+    """Inserts a batch of AgentLog rows in a single transaction."""
+    try:
+        with Session(engine) as session:
+            session.bulk_insert_mappings(AgentLog, batch) # type: ignore
+            session.commit()
+    except Exception as e:
+        logger.error("[AgentLogger] Failed to write %d log entries: %s", len(batch), e)
+
+def _flusher():
+    """Collects up to _FLUSH_BATCH_SIZE entries or _FLUSH_INTERVAL seconds worth, then commits."""
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + _FLUSH_INTERVAL
+        while len(batch) < _FLUSH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_batch(batch)
+        for _ in batch:
+            _log_queue.task_done()
+
+def flush_logs():
+    """Writes every queued entry and waits for in-flight batches. Registered to run at exit."""
+    batch = []
+    while True:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_batch(batch)
+        for _ in batch:
+            _log_queue.task_done()
+    _log_queue.join()
+
+def queue_agent_log(project_id: int, agent_name: str, message: str, cost: float = 0.0, severity: str = "INFO"):
+    """Enqueues an AgentLog row for the background flusher (non-blocking).
+
+    ERROR rows are written immediately: ProjectOS.update_status derives health
+    from the ERROR count, so they must be visible before the node reports status.
+    """
+    entry = {
+        "project_id": project_id,
+        "agent_name": agent_name,
+        "message": message,
+        "cost_incurred": cost,
+        "severity": severity,
+        "timestamp": datetime.utcnow()
+    }
+    if severity == "ERROR":
+        _write_batch([entry])
+    else:
+        _log_queue.put_nowait(entry)
+
+def configure_logging(level: int = logging.INFO):
+    """Installs a buffered console handler on the root logger (no-op if one is already configured).
+
+    Records are held in memory and written in batches of _LOG_BUFFER_CAPACITY,
+    or immediately when a WARNING or above arrives.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    root.addHandler(logging.handlers.MemoryHandler(
+        capacity=_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=stream_handler
+    ))
+    root.setLevel(level)
+
+_flusher_thread = threading.Thread(target=_flusher, name="agent-log-flusher", daemon=True)
+_flusher_thread.start()
+atexit.register(flush_logs)
+
 class AgentLogger:
     def __init__(self, project_id: int):
         self.project_id = project_id
 
     def log(self, agent_name: str, message: str, cost: float = 0.0, severity: str = "INFO"):
-        with Session(engine) as session:
-            log_entry = AgentLog(
-                project_id=self.project_id,
-                agent_name=agent_name,
-                message=message,
-                cost_incurred=cost,
-                severity=severity
-            )
-            session.add(log_entry)
-            session.commit()
-            print(f"[{agent_name}] {message} (Cost: ${cost})")
+        queue_agent_log(self.project_id, agent_name, message, cost=cost, severity=severity)
+        logger.info("[%s] %s (Cost: $%s)", agent_name, message, cost)
@@ -1,4 +1,4 @@
-from typing import TypedDict, List, Dict, Any, Optional
+from typing import TypedDict, List, Dict, Any, Optional, Annotated
 from pydantic import BaseModel, Field # type: ignore
 
 # --- Domain Models ---
@@ -29,6 +29,10 @@ class SocialPost(BaseModel):
 
 # --- Studio State ---
 
+def _latest(_current: Any, update: Any) -> Any:
+    """Reducer: last write wins (lets parallel branches report the same key)."""
+    return update
+
 class StudioState(TypedDict):
     """
     The shared state of the AI Studio.
@@ -41,6 +45,8 @@ class StudioState(TypedDict):
     project_budget_tokens: float # The "Bank"
     project_status: str
     integrator: Optional[Any] # Reference to the Integrator Agent
+    current_status: Annotated[str, _latest] # Cached Project.status (refreshed at the review gate)
+    review_status: Annotated[str, _latest] # Cached Project.review_status
     
     # Creative Data
     brand_dna_json: Optional[Dict[str, Any]]
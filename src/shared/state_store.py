@@ -1,5 +1,7 @@
+import gzip
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -7,6 +9,11 @@ from src.shared.db import Project, Session, engine # type: ignore
 
 logger = logging.getLogger(__name__)
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+_MAX_JSON_DEPTH = 32 # Also guards against self-referencing containers
+_GZIP_THRESHOLD = 64 * 1024 # Checkpoints larger than this are written gzipped
+_PRETTY_CHECKPOINTS = os.environ.get("STUDIO_PRETTY_CHECKPOINTS") == "1" # Dev-only indented output
+
 class StateStore:
     """
     Persistent State Store (The Black Box).
@@ -14,12 +21,18 @@ class StateStore:
     """
     
     @staticmethod
-    def _is_jsonable(x):
-        try:
-            json.dumps(x)
-            return True
-        except:
+    def _is_jsonable(x, depth: int = 0) -> bool:
+        """Structural JSON check: walks the value with isinstance only, no trial json.dumps.
+        Dict keys may be any scalar json.dumps accepts (str, int, float, bool, None)."""
+        if depth > _MAX_JSON_DEPTH:
             return False
+        if isinstance(x, _JSON_SCALARS):
+            return True
+        if isinstance(x, (list, tuple)):
+            return all(StateStore._is_jsonable(item, depth + 1) for item in x)
+        if isinstance(x, dict):
+            return all(isinstance(k, _JSON_SCALARS) and StateStore._is_jsonable(v, depth + 1) for k, v in x.items())
+        return False
 
     @staticmethod
     def save_checkpoint(project_id: int, node_name: str, state: Dict[str, Any]):
@@ -29,15 +42,11 @@ class StateStore:
             serializable_state = {}
             for k, v in state.items():
                 if k == "integrator": continue # Skip the agent object
-                try:
-                    # Test serialization
-                    json.dumps(v)
+                if StateStore._is_jsonable(v):
                     serializable_state[k] = v
-                except (TypeError, OverflowError):
-                    # If it's a dict, try to filter it
-                    if isinstance(v, dict):
-                        serializable_state[k] = {sk: sv for sk, sv in v.items() if self._is_jsonable(sv)} # type: ignore
-                    continue
+                elif isinstance(v, dict):
+                    # If it's a dict, keep only its serializable entries
+                    serializable_state[k] = {sk: sv for sk, sv in v.items() if StateStore._is_jsonable(sv)}
             
             snapshot = {
                 "timestamp": datetime.utcnow().isoformat(),
@@ -51,9 +60,20 @@ class StateStore:
             checkpoint_dir = Path("storage/checkpoints") / safe_name
             checkpoint_dir.mkdir(parents=True, exist_ok=True)
             
-            checkpoint_file = checkpoint_dir / f"latest.json"
-            with open(checkpoint_file, "w") as f:
-                json.dump(snapshot, f, indent=4)
+            if _PRETTY_CHECKPOINTS:
+                blob = json.dumps(snapshot, indent=2).encode("utf-8")
+            else:
+                blob = json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+
+            json_file = checkpoint_dir / "latest.json"
+            gz_file = checkpoint_dir / "latest.json.gz"
+            if len(blob) > _GZIP_THRESHOLD:
+                with gzip.open(gz_file, "wb", compresslevel=1) as f:
+                    f.write(blob)
+                json_file.unlink(missing_ok=True)
+            else:
+                json_file.write_bytes(blob)
+                gz_file.unlink(missing_ok=True)
                 
             # 3. DB Persistence (Primary)
             with Session(engine) as session:
@@ -82,12 +102,16 @@ class StateStore:
                     return None
                     
                 safe_name = str(project.name).replace(" ", "_").replace("/", "-")
-                checkpoint_file = Path("storage/checkpoints") / safe_name / "latest.json"
+                checkpoint_dir = Path("storage/checkpoints") / safe_name
+                gz_file = checkpoint_dir / "latest.json.gz"
+                json_file = checkpoint_dir / "latest.json"
                 
-                if checkpoint_file.exists():
-                    with open(checkpoint_file, "r") as f:
-                        data = json.load(f)
-                        return data.get("state")
+                if gz_file.exists():
+                    with gzip.open(gz_file, "rb") as f:
+                        return json.load(f).get("state")
+                if json_file.exists():
+                    with open(json_file, "r") as f:
+                        return json.load(f).get("state")
             return None
         except Exception as e:
             logger.error(f"[StateStore] Failed to load checkpoint: {e}")
@@ -95,14 +119,6 @@ class StateStore:
 
     @staticmethod
     def audit_trail(project_id: int, message: str, agent: str = "System"):
-        """Logs a high-integrity audit entry to the AgentLog table."""
-        from src.shared.db import AgentLog # type: ignore
-        with Session(engine) as session:
-            log = AgentLog(
-                project_id=project_id,
-                agent_name=agent,
-                message=message,
-                severity="INFO"
-            )
-            session.add(log)
-            session.commit()
+        """Logs a high-integrity audit entry to the AgentLog table (batched by the log flusher)."""
+        from src.shared.logger import queue_agent_log # type: ignore
+        queue_agent_log(project_id, agent, message, severity="INFO")
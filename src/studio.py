@@ -21,19 +21,24 @@ from src.meta_core.architect import chief_architect # type: ignore
 
 import os
 import json
+import functools
+import logging
 from langchain_google_genai import ChatGoogleGenerativeAI  # type: ignore
 from langchain_core.prompts import PromptTemplate, ChatPromptTemplate  # type: ignore
 from langchain_core.output_parsers import JsonOutputParser  # type: ignore
 from src.models import BrandDNA  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
 def _build_workflow():
-    """Builds and compiles the LangGraph workflow. Reusable across entrypoints."""
+    """Builds and compiles the LangGraph workflow. Cached: compiled once per process."""
     workflow = StateGraph(StudioState)
     
     def persistent_node(name, func):
         """Wrapper to ensure every node saves a persistent checkpoint."""
         def wrapper(state: StudioState):
-            print(f"--- [OS] Persistent Node: {name} ---")
+            logger.debug("--- [OS] Persistent Node: %s ---", name)
             
             result = func(state)
             if not isinstance(result, dict):
@@ -51,15 +56,14 @@ def _build_workflow():
             StateStore.save_checkpoint(state["project_id"], name, clean_state)
             
             # Sync operational truth to DB
-            from src.shared.db import ProjectOS, Session, engine, Project # type: ignore
+            from src.shared.db import ProjectOS # type: ignore
             
-            # Check if current status is already 'High Value' (e.g. Needs Review)
-            with Session(engine) as session:
-                project = session.get(Project, state["project_id"])
-                current_status = project.status if project else ""
+            # Check if current status is already 'High Value' (e.g. Needs Review).
+            # Status is carried in state; only the director and the review gate change it.
+            current_status = new_state.get("current_status") or ""
                 
             if "Review" not in current_status and "Ready" not in current_status:
-                ProjectOS.update_status(state["project_id"], name, f"Agent {name} Active", cycles=new_state.get("cycle_count", 0))
+                result["current_status"] = ProjectOS.update_status(state["project_id"], name, f"Agent {name} Active", cycles=new_state.get("cycle_count", 0))
             else:
                 # Just update pulse/health without overwriting status
                 ProjectOS.update_status(state["project_id"], name, current_status, cycles=new_state.get("cycle_count", 0))
@@ -108,18 +112,25 @@ def _build_workflow():
     workflow.add_edge("director", "check_review_gate")
 
     # Review Gate Logic
-    def check_review_status(state: StudioState):
+    def refresh_review_state(state: StudioState):
+        """The founder's decision is made outside the graph, so the gate re-reads it once here."""
         if state.get("methodology") == "VERIFICATION":
-            return "approved"
+            return {}
         from src.shared.db import Project, Session, engine  # type: ignore
         with Session(engine) as session:
             project = session.get(Project, state["project_id"])
-            if project and project.review_status == "APPROVED":
-                return "approved"
-            return "pending"
+            if not project:
+                return {}
+            return {"current_status": project.status, "review_status": project.review_status}
 
-    # Pass-through node for clarity before the final gate
-    workflow.add_node("check_review_gate", lambda x: x)
+    def check_review_status(state: StudioState):
+        if state.get("methodology") == "VERIFICATION":
+            return "approved"
+        if state.get("review_status") == "APPROVED":
+            return "approved"
+        return "pending"
+
+    workflow.add_node("check_review_gate", refresh_review_state)
     
     workflow.add_conditional_edges(
         "check_review_gate",
@@ -141,29 +152,40 @@ def _build_workflow():
     return workflow.compile()
 
 
+def invalidate_workflow():
+    """Drops the cached compiled workflow (e.g. after a code reload in dev)."""
+    _build_workflow.cache_clear()
+
+
 def run_studio_pipeline(brief: str, budget: float = 1000.0, project_name: str = "Untitled Project", methodology: str = "STANDARD", clarifying_questions: List[str] = [], project_id: Optional[int] = None):
     """
     Run the full creative pipeline for a given brief.
     """
     from src.shared.db import create_db_and_tables, Project, Session, engine  # type: ignore
     from src.operative_core.integrator import IntegratorAgent, GeminiIntegration, DriveIntegration  # type: ignore
+    from src.shared.logger import configure_logging, flush_logs  # type: ignore
     
+    configure_logging()
+
     # Init DB
     create_db_and_tables()
     
     # 1. Project Initialization & Resume Logic
+    is_resume = project_id is not None
+    current_status, review_status = "Intake", "PENDING"
     if project_id is None:
+        from sqlalchemy import insert  # type: ignore
         with Session(engine) as session:
-            project = Project(
-                name=project_name, 
-                client_brief=brief, 
-                budget_cap=budget,
-                status="Intake"
+            # INSERT ... RETURNING: one round trip for the row and its id (no refresh SELECT)
+            project_id = session.scalar(
+                insert(Project).returning(Project.id).values(
+                    name=project_name, 
+                    client_brief=brief, 
+                    budget_cap=budget,
+                    status="Intake"
+                )
             )
-            session.add(project)
             session.commit()
-            session.refresh(project)
-            project_id = project.id # type: ignore
     else:
         # RESUME LOGIC (The Black Box)
         with Session(engine) as session:
@@ -172,12 +194,14 @@ def run_studio_pipeline(brief: str, budget: float = 1000.0, project_name: str =
                 brief = project.client_brief
                 project_name = project.name
                 project.status = "Resuming"
+                current_status, review_status = project.status, project.review_status
                 session.add(project)
                 session.commit()
-        
-        cached_state = StateStore.load_checkpoint(project_id)
-        if cached_state:
-            print(f"--- [OS] Resuming Project {project_id} from Black Box ---")
+
+    # Read the Black Box once; reused for the initial state merge below
+    cached_state = StateStore.load_checkpoint(project_id) if project_id else None
+    if is_resume and cached_state:
+        print(f"--- [OS] Resuming Project {project_id} from Black Box ---")
 
     # 2. Financial Lock (CFO Gate)
     from src.shared.bank import StudioBank, COST_TABLE # type: ignore
@@ -194,6 +218,7 @@ def run_studio_pipeline(brief: str, budget: float = 1000.0, project_name: str =
                 project.status = "LOCKED: Insufficient Funds"
                 session.add(project)
                 session.commit()
+        flush_logs()
         return {"error": "FINANCIAL_LOCK_ACTIVE"}
     else:
         # Ensure lock is cleared if funds are sufficient
@@ -234,11 +259,17 @@ def run_studio_pipeline(brief: str, budget: float = 1000.0, project_name: str =
         "is_complete": len(clarifying_questions) == 0
     }
     
-    if project_id and StateStore.load_checkpoint(project_id):
-         # Merge with cached state for real resume
-         initial_state.update(StateStore.load_checkpoint(project_id)) # type: ignore
+    if cached_state:
+        # Merge with cached state for real resume
+        initial_state.update(cached_state)
+
+    # Live DB status always wins over the checkpointed copy
+    initial_state["current_status"] = current_status
+    initial_state["review_status"] = review_status
 
     result = app.invoke(initial_state)
+    # Callers audit AgentLog right after the run (nightly audit, spend sums); land queued rows first
+    flush_logs()
     
     print("\n--- Studio Run Complete ---")
     return result
@@ -1,8 +1,15 @@
-import json
-import time
+import asyncio
 from datetime import datetime, timedelta
+from sqlalchemy import insert # type: ignore
 from src.shared.db import create_db_and_tables, Project, Session, engine, ProjectOS, CalendarEvent, GlobalTask
 
+# Seed schedule offsets (relative to seeding time)
+H1, H2, H4, H5, H6 = (timedelta(hours=h) for h in (1, 2, 4, 5, 6))
+D1H2 = timedelta(days=1, hours=2)
+D1H3 = timedelta(days=1, hours=3)
+D3 = timedelta(days=3)
+D7 = timedelta(days=7)
+
 def seed_studio_lifecycle():
     print("--- [Simulator] Seeding Studio Life-Cycle (Founder Cockpit v12.1) ---")
     
@@ -13,81 +20,94 @@ def seed_studio_lifecycle():
         # 2. Seed Calendar
         now = datetime.utcnow()
         events = [
-            CalendarEvent(title="Vanguard Contract Review", start_time=now + timedelta(hours=1), end_time=now + timedelta(hours=2), location="Zoom", is_critical=True),
-            CalendarEvent(title="Alpha Design Sprint", start_time=now + timedelta(hours=4), end_time=now + timedelta(hours=5), location="Studio Boardroom"),
-            CalendarEvent(title="New Lead: Ocean Pulse", start_time=now + timedelta(days=1, hours=2), end_time=now + timedelta(days=1, hours=3), location="Google Meet")
+            {"title": "Vanguard Contract Review", "start_time": now + H1, "end_time": now + H2, "location": "Zoom", "is_critical": True},
+            {"title": "Alpha Design Sprint", "start_time": now + H4, "end_time": now + H5, "location": "Studio Boardroom", "is_critical": False},
+            {"title": "New Lead: Ocean Pulse", "start_time": now + D1H2, "end_time": now + D1H3, "location": "Google Meet", "is_critical": False}
         ]
         
         # 3. Seed Global Tasks
         tasks = [
-            GlobalTask(title="Submit Q1 Tax Report", due_date=now + timedelta(days=3), priority="High"),
-            GlobalTask(title="Update Studio Brand DNA", due_date=now + timedelta(days=7), priority="Normal"),
-            GlobalTask(title="Review Chief OS Audit", due_date=now + timedelta(hours=6), priority="Normal")
+            {"title": "Submit Q1 Tax Report", "due_date": now + D3, "priority": "High"},
+            {"title": "Update Studio Brand DNA", "due_date": now + D7, "priority": "Normal"},
+            {"title": "Review Chief OS Audit", "due_date": now + H6, "priority": "Normal"}
         ]
         
         # 4. Seed Multi-Stage Projects
+        # Rows in one executemany must share a key set, so optional columns are listed explicitly
         projects = [
-            Project(
-                name="Vanguard Rebrand",
-                client_brief="Cyber-security branding pass.",
-                budget_cap=12000.0,
-                internal_margin=45.0,
-                internal_cost=6500.0,
-                stage="Design",
-                status="Strategic Guardrail Alignment in progress.",
-                health_score=88,
-                next_milestone="Asset Selection",
-                executive_summary="Targeting high-trust obsidian aesthetics for the security sector."
-            ),
-            Project(
-                name="Neon Dream Campaign",
-                client_brief="Retro-synth aesthetic for social assets.",
-                budget_cap=4500.0,
-                internal_margin=22.0,
-                internal_cost=3200.0,
-                stage="Delivery",
-                status="Intelligence gathering complete.",
-                health_score=42,
-                next_milestone="Final Export",
-                blocker_summary="Low margin alert: Review scope drift.",
-                review_status="PENDING"
-            ),
-            Project(
-                name="Siren Audio Identity",
-                client_brief="Sonic branding for automotive startup.",
-                budget_cap=15000.0,
-                internal_margin=55.0,
-                internal_cost=2500.0,
-                stage="Strategy",
-                status="Brand DNA & Positioning drafted.",
-                health_score=99,
-                next_milestone="Intelligence Review"
-            )
+            {
+                "name": "Vanguard Rebrand",
+                "client_brief": "Cyber-security branding pass.",
+                "budget_cap": 12000.0,
+                "internal_margin": 45.0,
+                "internal_cost": 6500.0,
+                "stage": "Design",
+                "status": "Strategic Guardrail Alignment in progress.",
+                "health_score": 88,
+                "next_milestone": "Asset Selection",
+                "executive_summary": "Targeting high-trust obsidian aesthetics for the security sector.",
+                "blocker_summary": None,
+                "review_status": "PENDING"
+            },
+            {
+                "name": "Neon Dream Campaign",
+                "client_brief": "Retro-synth aesthetic for social assets.",
+                "budget_cap": 4500.0,
+                "internal_margin": 22.0,
+                "internal_cost": 3200.0,
+                "stage": "Delivery",
+                "status": "Intelligence gathering complete.",
+                "health_score": 42,
+                "next_milestone": "Final Export",
+                "executive_summary": None,
+                "blocker_summary": "Low margin alert: Review scope drift.",
+                "review_status": "PENDING"
+            },
+            {
+                "name": "Siren Audio Identity",
+                "client_brief": "Sonic branding for automotive startup.",
+                "budget_cap": 15000.0,
+                "internal_margin": 55.0,
+                "internal_cost": 2500.0,
+                "stage": "Strategy",
+                "status": "Brand DNA & Positioning drafted.",
+                "health_score": 99,
+                "next_milestone": "Intelligence Review",
+                "executive_summary": None,
+                "blocker_summary": None,
+                "review_status": "PENDING"
+            }
         ]
         
-        session.add_all(events)
-        session.add_all(tasks)
-        session.add_all(projects)
+        # Core executemany: one batched INSERT per table instead of per-row unit-of-work flushes
+        session.execute(insert(CalendarEvent), events)
+        session.execute(insert(GlobalTask), tasks)
+        session.execute(insert(Project), projects)
         session.commit()
     
     print("✅ Studio Heartbeat Seeding Complete.")
 
-def simulate_live_updates():
+async def simulate_live_updates():
     print("\n--- [Simulator] Starting Live Intelligence Pulse ---")
     try:
-        # Simulate active agent intelligence flowing in
+        # Simulate active agent intelligence flowing in.
+        # ProjectOS calls are blocking DB writes, so they run off the event loop.
         research_snip = ["Market Gap: Emotional Resonance is missing in competitor A", "Trend: Hyper-minimalism is saturated"]
-        ProjectOS.update_intelligence(3, "research", research_snip)
-        ProjectOS.update_status(3, "Researcher", "Scanning market gaps and competitor landscape...")
+        await asyncio.to_thread(ProjectOS.batch_update, 3, [
+            {"key": "research", "value": research_snip},
+            {"agent": "Researcher", "status": "Scanning market gaps and competitor landscape..."}
+        ])
         
-        time.sleep(2)
+        await asyncio.sleep(2)
         print("Pulse: Agent Researcher pushing Market Intelligence...")
         
         strategy_snip = ["North Star: Speed as a Luxury", "Value Prop: Autonomous Elegance"]
-        ProjectOS.update_intelligence(3, "strategy", strategy_snip)
-        ProjectOS.update_status(3, "Strategist", "Strategic Guardrail Alignment in progress.")
+        await asyncio.to_thread(ProjectOS.batch_update, 3, [
+            {"key": "strategy", "value": strategy_snip},
+            {"agent": "Strategist", "status": "Strategic Guardrail Alignment in progress."}
+        ])
         
-        time.sleep(2)
+        await asyncio.sleep(2)
         print("Pulse: Agent Strategist pushing Strategic Guardrails...")
         
         print("\n--- [Simulation Complete] Studio is now in high-fidelity steady state. ---")
@@ -98,4 +118,4 @@ def simulate_live_updates():
 
 if __name__ == "__main__":
     seed_studio_lifecycle()
-    simulate_live_updates()
+    asyncio.run(simulate_live_updates())
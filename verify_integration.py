@@ -1,8 +1,16 @@
 import sys
-import json
+import orjson
 from src.operative_core.studio import studio
+from types import MappingProxyType
 from src.operative_core.agent_base import AgentInput
 
+# Fixed Director test fixture, built once at import (read-only views, shared across runs)
+CATALOG = tuple(MappingProxyType(item) for item in (
+    {"key": "logo", "title": "Logo", "cost": 1000},
+    {"key": "web", "title": "Website", "cost": 3000},
+    {"key": "video", "title": "Brand Video", "cost": 5000}
+))
+
 def verify_integration():
     print("--- 🏛️  Verifying Templo Atelier vFinal Integration ---")
     
@@ -37,7 +45,7 @@ def verify_integration():
         out = strategist.run(inp)
         print(f"✅ Strategist Output Confidence: {out.confidence}")
         if out.confidence > 0:
-            print(f"   Structure: {json.dumps(out.structured_data, indent=2)}")
+            print(f"   Structure: {orjson.dumps(out.structured_data, option=orjson.OPT_INDENT_2).decode()}")
         else:
             print("   (Mock/Error output received, expected if API key missing)")
     except Exception as e:
@@ -54,11 +62,7 @@ def verify_integration():
             },
             parameters={
                 "budget": 5000,
-                "catalog": [
-                    {"key": "logo", "title": "Logo", "cost": 1000},
-                    {"key": "web", "title": "Website", "cost": 3000},
-                    {"key": "video", "title": "Brand Video", "cost": 5000}
-                ]
+                "catalog": CATALOG
             }
         )
         out = director.run(inp)
@@ -1,47 +1,63 @@
+import orjson
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
-def verify_v15_api():
+BASE_URL = "http://localhost:8001/founder/project"
+
+def _fetch_project(http: requests.Session, project_id: int):
+    url = f"{BASE_URL}/{project_id}"
+    print(f"GET {url}...")
+    return project_id, http.get(url)
+
+def _check_payload(data: dict):
+    # Documents
+    if "documents" in data and len(data["documents"]) > 0:
+        print(f"✅ Documents Found: {len(data['documents'])} (Folders verified)")
+    else:
+        print("❌ Documents Data Missing or Empty")
+
+    # Requests
+    if "requests" in data and len(data["requests"]) > 0:
+        print(f"✅ Agent Requests Found: {len(data['requests'])}")
+    else:
+        print("❌ Agent Requests Data Missing or Empty")
+
+    # Creative Mode
+    if "creative_mode" in data:
+        cm = data["creative_mode"]
+        print(f"✅ Creative Mode Context: {cm.get('objective', 'Missing')}")
+    else:
+        print("❌ Creative Mode Data Missing")
+
+    # Command Center Core
+    if "overview" in data or "project" in data: # project is the main key now
+         print("✅ 10-Part Core Data Present")
+
+def verify_v15_api(project_ids=(1,)):
     print("--- [Founder OS v15.0] API Verification ---")
     try:
-        # 1. Fetch Maldonado Project (ID 1)
-        url = "http://localhost:8001/founder/project/1"
-        print(f"GET {url}...")
-        res = requests.get(url)
-        
-        if res.status_code != 200:
-            print(f"❌ API Failed: {res.status_code}")
-            print(res.text)
-            sys.exit(1)
-            
-        data = res.json()
-        print("✅ Project Payload Received")
-        
-        # 2. Check for New Command Center Fields
-        
-        # Documents
-        if "documents" in data and len(data["documents"]) > 0:
-            print(f"✅ Documents Found: {len(data['documents'])} (Folders verified)")
-        else:
-            print("❌ Documents Data Missing or Empty")
-            
-        # Requests
-        if "requests" in data and len(data["requests"]) > 0:
-            print(f"✅ Agent Requests Found: {len(data['requests'])}")
-        else:
-            print("❌ Agent Requests Data Missing or Empty")
-
-        # Creative Mode
-        if "creative_mode" in data:
-            cm = data["creative_mode"]
-            print(f"✅ Creative Mode Context: {cm.get('objective', 'Missing')}")
-        else:
-            print("❌ Creative Mode Data Missing")
-
-        # Command Center Core
-        if "overview" in data or "project" in data: # project is the main key now
-             print("✅ 10-Part Core Data Present")
-        
+        # 1. Fetch projects concurrently (default: Maldonado, ID 1) over one pooled session,
+        # so wall time is the slowest response rather than the sum of all of them
+        with requests.Session() as http:
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            http.mount("http://", adapter)
+            with ThreadPoolExecutor(max_workers=min(len(project_ids), 10)) as pool:
+                responses = list(pool.map(lambda pid: _fetch_project(http, pid), project_ids))
+
+        for project_id, res in responses:
+            if res.status_code != 200:
+                print(f"❌ API Failed for project {project_id}: {res.status_code}")
+                print(res.text)
+                sys.exit(1)
+
+            data = orjson.loads(res.content) # parse the raw bytes, no text decode
+            print(f"✅ Project {project_id} Payload Received")
+
+            # 2. Check for New Command Center Fields
+            _check_payload(data)
+
         print("\n--- v15.0 API Verification PASSED ---")
 
     except Exception as e:
@@ -49,4 +65,4 @@ def verify_v15_api():
         sys.exit(1)
 
 if __name__ == "__main__":
-    verify_v15_api()
+    verify_v15_api([int(arg) for arg in sys.argv[1:]] or (1,))
@@ -1,12 +1,6 @@
-import os
-import sys
+import io
 from pathlib import Path
 
-# Add src to path
-import sys
-import os
-sys.path.insert(0, os.getcwd())
-
 from src.shared.drive_utils import get_drive_service, find_folder, ensure_folder  # type: ignore
 
 def upload_v2_test():
@@ -47,10 +41,14 @@ Budget: $2500
         'mimeType': 'text/plain'
     }
     
-    from googleapiclient.http import MediaInMemoryUpload # type: ignore
-    media = MediaInMemoryUpload(content.encode('utf-8'), mimetype='text/plain')
+    from googleapiclient.http import MediaIoBaseUpload # type: ignore
+    media = MediaIoBaseUpload(io.BytesIO(content.encode('utf-8')), mimetype='text/plain', chunksize=1 << 20, resumable=True)
     
-    file = drive.files().create(body=file_metadata, media_body=media, fields='id').execute()
+    # Stream in 1 MB chunks so MB-scale kickoff files can resume instead of restarting
+    request = drive.files().create(body=file_metadata, media_body=media, fields='id')
+    file = None
+    while file is None:
+        _, file = request.next_chunk()
     print(f"Uploaded test file: {file['id']}")
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
-import sys
 import os
-sys.path.insert(0, os.getcwd())
+
+# Fixed brief: reuse cached LLM answers across runs (must be set before src imports)
+os.environ.setdefault("STUDIO_LLM_CACHE", "1")
 
 from src.studio import run_studio_pipeline # type: ignore
 from dotenv import load_dotenv # type: ignore
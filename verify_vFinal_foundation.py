@@ -1,5 +1,6 @@
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from src.operative_core.models.memory import KnowledgeVector, EntityNode, RegulationRule
 from src.engines.governance import GovernanceEngine, QARubric
 from src.engines.orchestrator import OrchestrationEngine, WorkflowNode, WorkflowState
@@ -95,7 +96,9 @@ def test_orchestration():
 
 if __name__ == "__main__":
     print("--- 🏛️  Verifying Templo Atelier vFinal Engines ---")
-    results = [test_memory_models(), test_governance(), test_orchestration()]
+    # Phases share no state; run them concurrently (output may interleave)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(lambda test: test(), [test_memory_models, test_governance, test_orchestration]))
     
     if all(results):
         print("\n✅ ALL SYSTEMS GREEN. Foundation Phase Complete.")
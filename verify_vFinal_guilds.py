@@ -1,5 +1,6 @@
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from src.operative_core.agent_base import BaseAgent, AgentInput
 from src.guilds.command import DirectorAgent
 from src.guilds.strategy import BrandStrategist, Anthropologist
@@ -83,7 +84,9 @@ def test_qa_guild():
 
 if __name__ == "__main__":
     print("--- 🏛️  Verifying Templo Atelier vFinal Guilds ---")
-    results = [test_base_agent_contract(), test_strategy_guild(), test_production_guild(), test_qa_guild()]
+    # Guild checks are independent; run them concurrently (output may interleave)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda test: test(), [test_base_agent_contract, test_strategy_guild, test_production_guild, test_qa_guild]))
     
     if all(results):
         print("\n✅ ALL GUILDS OPERATIONAL.")
@@ -1,6 +1,14 @@
+"""
+Templo Atelier vFinal Tools verification.
+
+Run with:  pytest verify_vFinal_tools.py   (pytest -n auto with pytest-xdist)
+       or:  python verify_vFinal_tools.py  (runs the tests concurrently in threads)
+Engines are built once per module and shared by the tests.
+"""
 import sys
 import logging
-from datetime import datetime
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 from src.engines.economics import EconomicsEngine, Quote
 from src.engines.perception import PerceptionEngine, Signal
 from src.engines.tool_router import ToolRouter, ToolRequest
@@ -8,85 +16,135 @@ from src.engines.tool_router import ToolRouter, ToolRequest
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("verify_tools")
 
-def test_economics():
-    print("\n[1/3] Testing Economics Engine...")
-    try:
-        eco = EconomicsEngine()
-        proj = "proj_001"
-        eco.set_budget(proj, 10.00) # $10
-        
-        # Log cost (1M * 2M tokens) -> Should be small but non-zero
-        eco.log_cost(proj, "Strategist", "LLM", tokens_in=1000, tokens_out=500)
-        
-        if eco.check_budget(proj):
-            print(f"✅ Budget Check: Pass (Remaining: ${eco.budgets[proj].remaining:.4f})")
-        else:
-            print("❌ Budget Check Failed unexpectedly.")
-            return False
-            
-        quote = eco.generate_quote(proj, complexity_score=2)
-        print(f"✅ Quote Generated: ${quote.estimated_cost}")
-        return True
-    except Exception as e:
-        print(f"❌ Economics Error: {e}")
-        return False
+# conftest.py skips these tests while the listed modules and this file are unchanged since their last pass
+pytestmark = pytest.mark.engine_sources("src.engines.economics", "src.engines.perception", "src.engines.tool_router")
 
-def test_perception():
-    print("\n[2/3] Testing Perception Engine...")
-    try:
-        perc = PerceptionEngine()
-        sig = Signal(
-            domain="Tech", 
-            signal_type="Trend", 
-            entity="AI", 
-            element="Agents", 
-            observation="Agents replace apps."
+@pytest.fixture(scope="module")
+def eco():
+    return EconomicsEngine()
+
+@pytest.fixture(scope="module")
+def perc():
+    return PerceptionEngine()
+
+@pytest.fixture(scope="session")
+def router():
+    return ToolRouter()
+
+def test_economics(eco):
+    proj = "proj_001"
+    eco.set_budget(proj, 10.00) # $10
+
+    # Log cost (1M * 2M tokens) -> Should be small but non-zero
+    eco.log_cost(proj, "Strategist", "LLM", tokens_in=1000, tokens_out=500)
+
+    assert eco.check_budget(proj), f"Budget exhausted (Remaining: ${eco.budgets[proj].remaining:.4f})"
+
+    quote = eco.generate_quote(proj, complexity_score=2)
+    assert isinstance(quote, Quote)
+    assert quote.estimated_cost > 0
+
+    # A repeat quote is served from the cache as an equal but distinct copy
+    repeat = eco.generate_quote(proj, complexity_score=2)
+    assert repeat is not quote
+    assert repeat.model_dump(exclude={"valid_until"}) == quote.model_dump(exclude={"valid_until"})
+    repeat.estimated_cost = 0
+    assert eco.generate_quote(proj, complexity_score=2).estimated_cost == quote.estimated_cost
+
+    # Budget changes and new costs drop the project's cached quotes
+    eco.log_cost(proj, "Strategist", "LLM", tokens_in=10, tokens_out=5)
+    assert proj not in eco._quote_cache
+    eco.generate_quote(proj, complexity_score=2)
+    eco.set_budget(proj, 10.00)
+    assert proj not in eco._quote_cache
+
+    # Bulk logging must burn exactly what the same actions logged one by one would
+    batch_proj = "proj_002"
+    n = 10_000
+    eco.set_budget(batch_proj, 200.00)
+    eco.log_cost_batch(batch_proj, ["Strategist"] * n, ["LLM"] * n, [1000] * n, [500] * n)
+    single_cost = 1000 * eco.rates["token_input"] + 500 * eco.rates["token_output"] + eco.rates["tool_call"]
+    assert eco.budgets[batch_proj].current_burn == pytest.approx(n * single_cost)
+    assert eco.check_budget(batch_proj)
+
+def test_perception(perc):
+    sigs = [
+        Signal(
+            domain="Tech",
+            signal_type="Trend",
+            entity="AI",
+            element="Agents",
+            observation=f"Agents replace apps ({i})."
         )
-        perc.ingest_signal(sig)
-        
-        results = perc.query_reservoir("agents")
-        if len(results) > 0:
-            print(f"✅ Perception Query: Found {len(results)} signals.")
-            return True
-        else:
-            print("❌ Perception Query: No results found.")
-            return False
-    except Exception as e:
-        print(f"❌ Perception Error: {e}")
-        return False
+        for i in range(1000)
+    ]
+    perc.ingest_batch(sigs)
+    perc.ingest_batch(sigs) # re-reported signals are deduplicated
+    assert len(perc.reservoir) == len(sigs)
+
+    results = perc.query_reservoir("agents")
+    assert len(results) >= len(sigs), "Perception Query: No results found."
+
+    # Bounded reservoir: the oldest signals are evicted and may be re-ingested later
+    small = PerceptionEngine(capacity=10)
+    small.ingest_batch(sigs[:25])
+    assert small.reservoir == sigs[15:25]
+    assert small.query_reservoir("agents") == sigs[15:25]
+    assert small.query_reservoir("0") == [sigs[20]] # sigs[0] and sigs[10] were evicted
+    small.ingest_signal(sigs[0])
+    assert small.reservoir == sigs[16:25] + [sigs[0]]
+    assert small.query_reservoir("agents")[-1] is sigs[0]
+    with pytest.raises(ValueError):
+        PerceptionEngine(capacity=0)
 
-def test_tool_router():
-    print("\n[3/3] Testing Tool Router...")
+# (tool_name, action, params) routed through one shared router
+CASES = [
+    ("filesystem", "write", {"path": "test.txt", "content": "Hello"}),
+    ("filesystem", "read", {"path": "test.txt"}),
+    ("search", "query", {"query": "agentic studios"}),
+]
+
+@pytest.mark.parametrize("tool_name,action,params", CASES)
+def test_tool_router(router, tool_name, action, params):
+    # Defaults are registered in __init__
+    req = ToolRequest(
+        tool_name=tool_name,
+        action=action,
+        params=params,
+        requester_agent="Strategist"
+    )
+    res = router.route(req)
+    assert res.success, f"Tool Call Failed: {res.error}"
+
+STATUS = ("❌ {}", "✅ {}")  # indexed by pass/fail
+
+def _run(name, test, *args):
+    """Runs one test; returns (ok, report line) instead of printing from a worker thread."""
     try:
-        router = ToolRouter()
-        
-        # Register custom mock if needed, but defaults are registered in __init__
-        req = ToolRequest(
-            tool_name="filesystem",
-            action="write",
-            params={"path": "test.txt", "content": "Hello"},
-            requester_agent="Strategist"
-        )
-        res = router.route(req)
-        
-        if res.success:
-            print(f"✅ Tool Call Success: {res.data}")
-            return True
-        else:
-            print(f"❌ Tool Call Failed: {res.error}")
-            return False
-            
+        test(*args)
+        ok, detail = True, "passed"
     except Exception as e:
-        print(f"❌ Router Error: {e}")
-        return False
+        ok, detail = False, str(e) or type(e).__name__
+    return ok, STATUS[ok].format(f"{name}: {detail}")
 
 if __name__ == "__main__":
-    print("--- 🏛️  Verifying Templo Atelier vFinal Tools ---")
-    results = [test_economics(), test_perception(), test_tool_router()]
-    
-    if all(results):
-        print("\n✅ ALL ENGINES OPERATIONAL.")
-        sys.exit(0)
-    else:
-        print("\n❌ VERIFICATION FAILED.")
-        sys.exit(1)
+    report = ["--- 🏛️  Verifying Templo Atelier vFinal Tools ---"]
+    # The tests share no state except the router, whose route() only reads the registry
+    shared_router = ToolRouter()
+    jobs = [
+        ("Economics Engine", test_economics, EconomicsEngine()),
+        ("Perception Engine", test_perception, PerceptionEngine()),
+    ] + [
+        (f"Tool Router ({tool_name}.{action})", test_tool_router, shared_router, tool_name, action, params)
+        for tool_name, action, params in CASES
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [pool.submit(_run, *job) for job in jobs]
+        results = [f.result() for f in futures]
+
+    # Submission order, so the report reads the same on every run
+    report.extend(line for _, line in results)
+    ok = all(passed for passed, _ in results)
+    report.append("\n" + STATUS[ok].format(("VERIFICATION FAILED.", "ALL ENGINES OPERATIONAL.")[ok]))
+    sys.stdout.write("\n".join(report) + "\n")
+    sys.exit(0 if ok else 1)